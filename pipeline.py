@@ -10,20 +10,27 @@ and publishes a professional HTML digest.
 
 import os
 import sys
-import json
+import calendar
 import hashlib
 import logging
 import re
 from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from html import unescape
+from io import BytesIO
 from pathlib import Path
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin
 
 import yaml
+import ahocorasick
 import feedparser
 import httpx
-from bs4 import BeautifulSoup
-from jinja2 import Environment, FileSystemLoader
+import orjson
+from lxml import etree
+from selectolax.lexbor import LexborHTMLParser
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 
 # ---------------------------------------------------------------------------
 # CONFIG
@@ -33,14 +40,24 @@ SOURCES_FILE = ROOT / "sources.yaml"
 TEMPLATE_DIR = ROOT / "templates"
 OUTPUT_DIR = ROOT / "output"
 ARCHIVE_DIR = ROOT / "archive"
+JINJA_CACHE_DIR = ROOT / ".jinja_cache"
 
 OUTPUT_DIR.mkdir(exist_ok=True)
 ARCHIVE_DIR.mkdir(exist_ok=True)
+JINJA_CACHE_DIR.mkdir(exist_ok=True)
 
 MAX_ITEMS_PER_SOURCE = 15
 MAX_AGE_DAYS = 2
 REQUEST_TIMEOUT = 20
 MAX_ITEMS_PER_SECTION = 10
+FETCH_WORKERS = 32
+
+# Scraped links whose URL marks them as navigation or boilerplate
+_SKIP_RE = re.compile(
+    r"login|sign-in|subscribe|cookie|privacy|terms|contact|about-us|careers"
+    r"|javascript:|mailto:|#|facebook\.com|twitter\.com|linkedin\.com",
+    re.IGNORECASE,
+)
 
 logging.basicConfig(
     level=logging.INFO,
@@ -49,6 +66,25 @@ logging.basicConfig(
 )
 log = logging.getLogger("infra-digest")
 
+# One shared client so connections (and TLS sessions) are reused across sources
+_HTTP = httpx.Client(
+    http2=True,
+    timeout=REQUEST_TIMEOUT,
+    follow_redirects=True,
+    headers={
+        "User-Agent": "Mozilla/5.0 (Global Infrastructure Digest Bot; +https://politico94.github.io/global-infra-digest)"
+    },
+    limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+)
+
+# Compiled templates are cached on disk so repeat runs skip re-parsing them
+_JINJA = Environment(
+    loader=FileSystemLoader(str(TEMPLATE_DIR)),
+    bytecode_cache=FileSystemBytecodeCache(str(JINJA_CACHE_DIR)),
+    auto_reload=False,
+    autoescape=True,
+)
+
 # ---------------------------------------------------------------------------
 # SECTION CATEGORIZATION RULES
 # ---------------------------------------------------------------------------
@@ -178,33 +214,128 @@ def load_sources() -> dict:
 # FETCH
 # ---------------------------------------------------------------------------
 
+# Namespaces whose elements _fast_rss reads (RSS 2.0 has none)
+_ATOM_NS = "http://www.w3.org/2005/Atom"
+_RSS1_NS = "http://purl.org/rss/1.0/"
+_DC_NS = "http://purl.org/dc/elements/1.1/"
+_FEED_NAMESPACES = {None, _ATOM_NS, _RSS1_NS, _DC_NS}
+_FEED_ENTRY_TAGS = ("item", f"{{{_RSS1_NS}}}item", f"{{{_ATOM_NS}}}entry")
+
+
+def _parse_feed_date(value: str | None) -> datetime | None:
+    """Parse an RFC 822 (RSS) or ISO 8601 (Atom, Dublin Core) date as UTC."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        published = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            published = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    if published.tzinfo is None:
+        published = published.replace(tzinfo=timezone.utc)
+    return published.astimezone(timezone.utc)
+
+
+def _fast_rss(feed_bytes: bytes) -> list[dict]:
+    """Stream the first MAX_ITEMS_PER_SOURCE entries out of an RSS/Atom feed.
+
+    Only title, link, summary and date are read, and each entry is freed as
+    soon as it has been parsed. Raises etree.XMLSyntaxError on malformed XML.
+    """
+    entries = []
+    for _, elem in etree.iterparse(BytesIO(feed_bytes), events=("end",), tag=_FEED_ENTRY_TAGS):
+        fields = {}
+        for child in elem:
+            if not isinstance(child.tag, str):
+                continue  # comments and processing instructions
+            qname = etree.QName(child)
+            if qname.namespace not in _FEED_NAMESPACES:
+                continue
+            if qname.localname == "link" and child.get("href") is not None:
+                # Atom links carry the URL in href; only the alternate one is the article
+                if child.get("rel", "alternate") != "alternate":
+                    continue
+                value = child.get("href")
+            elif qname.localname == "guid" and child.get("isPermaLink", "true").strip().lower() == "false":
+                continue  # an opaque ID, not a URL
+            else:
+                value = "".join(child.itertext())
+            fields.setdefault(qname.localname, value)
+
+        entries.append({
+            "title": fields.get("title", ""),
+            # Like feedparser, fall back to a permalink guid when there's no <link>
+            "link": fields.get("link") or fields.get("guid", ""),
+            "summary": fields.get("description") or fields.get("summary") or fields.get("content", ""),
+            "published": _parse_feed_date(
+                fields.get("pubDate") or fields.get("published")
+                or fields.get("updated") or fields.get("date")
+            ),
+        })
+
+        elem.clear()
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+        if len(entries) >= MAX_ITEMS_PER_SOURCE:
+            break
+    return entries
+
+
+def _feedparser_entries(feed_bytes: bytes) -> list[dict]:
+    """Slow path for feeds _fast_rss can't read, in the same entry shape."""
+    feed = feedparser.parse(feed_bytes)
+    entries = []
+    for entry in feed.entries[:MAX_ITEMS_PER_SOURCE]:
+        published = None
+        for date_field in ("published_parsed", "updated_parsed"):
+            t = getattr(entry, date_field, None)
+            if t:
+                # feedparser normalizes to a UTC struct_time
+                published = datetime.fromtimestamp(calendar.timegm(t), tz=timezone.utc)
+                break
+
+        entries.append({
+            "title": entry.get("title", ""),
+            "link": entry.get("link", ""),
+            "summary": entry.get("summary", "") or entry.get("description", ""),
+            "published": published,
+        })
+    return entries
+
+
 def fetch_rss(source: dict) -> list[dict]:
     """Parse an RSS/Atom feed and return normalized items."""
     items = []
     try:
         feed_url = source.get("feed", source["url"])
-        feed = feedparser.parse(feed_url)
+        r = _HTTP.get(feed_url)
+        r.raise_for_status()
         cutoff = datetime.now(timezone.utc) - timedelta(days=MAX_AGE_DAYS)
 
-        for entry in feed.entries[:MAX_ITEMS_PER_SOURCE]:
-            published = None
-            for date_field in ("published_parsed", "updated_parsed"):
-                t = getattr(entry, date_field, None)
-                if t:
-                    from time import mktime
-                    published = datetime.fromtimestamp(mktime(t), tz=timezone.utc)
-                    break
+        try:
+            entries = _fast_rss(r.content)
+        except etree.XMLSyntaxError:
+            entries = []
+        if not entries:
+            # Malformed XML or a feed format we don't stream; let feedparser try
+            entries = _feedparser_entries(r.content)
 
+        for entry in entries:
+            published = entry["published"]
             if published and published < cutoff:
                 continue
 
-            title = entry.get("title", "").strip()
-            url = entry.get("link", "").strip()
-            raw_summary = entry.get("summary", "") or entry.get("description", "")
-            summary = _clean_html(raw_summary)
+            title = entry["title"].strip()
+            url = entry["link"].strip()
+            summary = _clean_html(entry["summary"])
 
             if not title or len(title) < 10:
                 continue
+            if not url:
+                continue
 
             items.append({
                 "title": title,
@@ -223,17 +354,14 @@ def fetch_scrape(source: dict) -> list[dict]:
     """Scrape a webpage for recent links/headlines."""
     items = []
     try:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Global Infrastructure Digest Bot; +https://politico94.github.io/global-infra-digest)"
-        }
-        r = httpx.get(source["url"], headers=headers, timeout=REQUEST_TIMEOUT, follow_redirects=True)
+        r = _HTTP.get(source["url"])
         r.raise_for_status()
-        soup = BeautifulSoup(r.text, "html.parser")
+        tree = LexborHTMLParser(r.text)
 
         seen_urls = set()
-        for tag in soup.find_all("a", href=True):
-            title = tag.get_text(strip=True)
-            href = tag["href"]
+        for node in tree.css("a[href]"):
+            title = node.text(strip=True)
+            href = node.attributes.get("href") or ""
 
             if len(title) < 20 or len(title) > 300:
                 continue
@@ -245,12 +373,7 @@ def fetch_scrape(source: dict) -> list[dict]:
                 continue
 
             # Skip navigation / boilerplate links
-            skip_patterns = [
-                "login", "sign-in", "subscribe", "cookie", "privacy",
-                "terms", "contact", "about-us", "careers", "javascript:",
-                "mailto:", "#", "facebook.com", "twitter.com", "linkedin.com",
-            ]
-            if any(p in href.lower() for p in skip_patterns):
+            if _SKIP_RE.search(href):
                 continue
 
             seen_urls.add(href)
@@ -282,9 +405,29 @@ def fetch_source(source: dict) -> list[dict]:
 # FILTER & DEDUPLICATE
 # ---------------------------------------------------------------------------
 
+_WS_RE = re.compile(r"\s+")
+# Only unambiguous tags: no quoted attributes (which may hide a ">") or nested "<"
+_TAG_RE = re.compile(r"</?[A-Za-z][^<>\"']*>")
+# Markup whose contents a naive tag strip would leak into the text
+_UNSAFE_HTML_RE = re.compile(r"<(?:script|style|!--)", re.IGNORECASE)
+
+
+def _html_text(text: str) -> str:
+    """Extract visible text from an HTML fragment."""
+    tree = LexborHTMLParser(text)
+    tree.strip_tags(["script", "style"])
+    return tree.text(separator=" ", strip=True)
+
+
 def _clean_html(text: str) -> str:
-    soup = BeautifulSoup(text, "html.parser")
-    clean = soup.get_text(separator=" ", strip=True)
+    # Feed summaries are mostly plain text or simple <p>/<a> markup
+    clean = _TAG_RE.sub(" ", text)
+    if "<" in clean or _UNSAFE_HTML_RE.search(text):
+        # A stray "<" or a tag the regex can't safely strip; use a real parser
+        clean = _html_text(text)
+    else:
+        clean = unescape(clean)
+    clean = _WS_RE.sub(" ", clean).strip()
     # Truncate to ~300 chars at a word boundary
     if len(clean) > 300:
         clean = clean[:300].rsplit(" ", 1)[0] + "…"
@@ -292,26 +435,69 @@ def _clean_html(text: str) -> str:
 
 
 def _item_hash(item: dict) -> str:
-    raw = (item.get("title", "") + item.get("url", "")).lower().strip()
-    return hashlib.md5(raw.encode()).hexdigest()
+    """Return the item's dedup key, computing and caching it on first use."""
+    h = item.get("_hash")
+    if h is None:
+        # Titles vary in case between outlets; URLs are compared as given
+        raw = item.get("title", "").strip().lower() + item.get("url", "").strip()
+        h = item["_hash"] = hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+    return h
+
+
+def _item_text(item: dict) -> str:
+    """Return the lowercased title + summary used for keyword matching, cached on the item."""
+    text = item.get("_text")
+    if text is None:
+        text = item["_text"] = f"{item['title']} {item.get('summary', '')}".lower()
+    return text
+
+
+def _keyword_automaton(entries) -> ahocorasick.Automaton:
+    """Build an Aho–Corasick automaton from (keyword, key, weight) triples.
+
+    Each keyword's payload is (keyword, ((key, weight), ...)) so a keyword
+    listed under several keys is matched once and credits all of them.
+    """
+    grouped = defaultdict(list)
+    for kw, key, weight in entries:
+        grouped[kw.lower()].append((key, weight))
+
+    automaton = ahocorasick.Automaton()
+    for kw, hits in grouped.items():
+        automaton.add_word(kw, (kw, tuple(hits)))
+    automaton.make_automaton()
+    return automaton
+
+
+def _keyword_scores(automaton: ahocorasick.Automaton, text: str) -> dict:
+    """Sum keyword weights per key, counting each keyword at most once."""
+    scores = defaultdict(int)
+    if automaton.kind != ahocorasick.AHOCORASICK:
+        # No keywords were added
+        return scores
+
+    seen = set()
+    for _, (kw, hits) in automaton.iter(text):
+        if kw in seen:
+            continue
+        seen.add(kw)
+        for key, weight in hits:
+            scores[key] += weight
+    return scores
 
 
 def keyword_relevance(items: list[dict], config: dict) -> list[dict]:
     """Score items by infrastructure keyword relevance."""
-    primary = [k.lower() for k in config.get("keywords", {}).get("primary", [])]
-    secondary = [k.lower() for k in config.get("keywords", {}).get("secondary", [])]
+    keywords = config.get("keywords", {})
+    automaton = _keyword_automaton(
+        [(kw, None, 2) for kw in keywords.get("primary", [])]
+        + [(kw, None, 1) for kw in keywords.get("secondary", [])]
+    )
 
     scored = []
     for item in items:
-        text = f"{item['title']} {item.get('summary', '')}".lower()
-        score = 0
-
-        for kw in primary:
-            if kw in text:
-                score += 2
-        for kw in secondary:
-            if kw in text:
-                score += 1
+        text = _item_text(item)
+        score = _keyword_scores(automaton, text)[None]
 
         # Tier boost — Tier 1 sources are almost always relevant
         if item.get("tier") == 1:
@@ -341,6 +527,33 @@ def deduplicate(items: list[dict]) -> list[dict]:
 # RULE-BASED CATEGORIZATION (NO AI)
 # ---------------------------------------------------------------------------
 
+# Lowercased once at import so the per-item loops never re-normalize rules
+_SECTION_RULES_LOWER = {
+    section_id: {
+        "hints": tuple(h.lower() for h in rules["source_hints"]),
+        "keywords": tuple(k.lower() for k in rules["keywords"]),
+    }
+    for section_id, rules in SECTION_RULES.items()
+}
+
+# Sections by position; the automata below credit hits to these indices
+_SECTION_IDS = tuple(_SECTION_RULES_LOWER)
+
+# Section keywords are fixed, so match them all in one pass per item
+_SECTION_KEYWORDS_AC = _keyword_automaton(
+    (kw, idx, 1)
+    for idx, rules in enumerate(_SECTION_RULES_LOWER.values())
+    for kw in rules["keywords"]
+)
+
+# Source-name hints, matched against the lowercased source name
+_SECTION_HINTS_AC = _keyword_automaton(
+    (hint, idx, 1)
+    for idx, rules in enumerate(_SECTION_RULES_LOWER.values())
+    for hint in rules["hints"]
+)
+
+
 def categorize_items(items: list[dict]) -> dict:
     """Categorize items into sections using rule-based matching."""
     sections = {section_id: [] for section_id in SECTION_RULES}
@@ -350,31 +563,26 @@ def categorize_items(items: list[dict]) -> dict:
     items.sort(key=lambda x: x.get("relevance_score", 0), reverse=True)
 
     for item in items:
-        text = f"{item['title']} {item.get('summary', '')}".lower()
-        source_lower = item.get("source", "").lower()
-
-        best_section = None
-        best_score = 0
+        # Already published under another title; no need to score it
+        if item["url"] in used_urls:
+            continue
 
-        for section_id, rules in SECTION_RULES.items():
-            score = 0
+        text = _item_text(item)
+        source_lower = item.get("source", "").lower()
 
-            # Source name matching (strong signal)
-            for hint in rules["source_hints"]:
-                if hint in source_lower:
-                    score += 5
-                    break
+        scores = [0] * len(_SECTION_IDS)
+        for idx, weight in _keyword_scores(_SECTION_KEYWORDS_AC, text).items():
+            scores[idx] += weight
 
-            # Keyword matching
-            for kw in rules["keywords"]:
-                if kw in text:
-                    score += 1
+        # Source name matching (strong signal), counted once per section
+        for idx in _keyword_scores(_SECTION_HINTS_AC, source_lower):
+            scores[idx] += 5
 
-            if score > best_score:
-                best_score = score
-                best_section = section_id
+        # Ties go to the earlier section, as SECTION_RULES is ordered
+        best_score = max(scores)
+        best_section = _SECTION_IDS[scores.index(best_score)]
 
-        if best_section and best_score >= 2 and item["url"] not in used_urls:
+        if best_score >= 2:
             if len(sections[best_section]) < MAX_ITEMS_PER_SECTION:
                 # Assign significance based on tier + relevance
                 total_score = item.get("relevance_score", 0) + best_score
@@ -452,8 +660,7 @@ def generate_outlook(sections: dict) -> str:
 # ---------------------------------------------------------------------------
 
 def render_digest(sections: dict, pulse: str, outlook: str, config: dict) -> str:
-    env = Environment(loader=FileSystemLoader(str(TEMPLATE_DIR)))
-    template = env.get_template("digest.html")
+    template = _JINJA.get_template("digest.html")
 
     sections_config = {s["id"]: s for s in config.get("sections", [])}
 
@@ -495,14 +702,22 @@ def main():
         "canada", "project_finance", "climate_resilience", "smart_infra",
     ]
 
+    categories = []
     for cat_key in source_categories:
         category = config.get(cat_key, {})
-        sources = category.get("sources", [])
-        label = category.get("label", cat_key)
+        categories.append((category.get("label", cat_key), category.get("sources", [])))
+
+    # Fetching is network-bound, so run every source concurrently and
+    # report the results in registry order afterwards
+    all_sources = [source for _, sources in categories for source in sources]
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as pool:
+        results = iter(list(pool.map(fetch_source, all_sources)))
+
+    for label, sources in categories:
         log.info(f"\n--- {label} ({len(sources)} sources) ---")
 
         for source in sources:
-            items = fetch_source(source)
+            items = next(results)
             log.info(f"  {source['name']}: {len(items)} items")
             all_items.extend(items)
 
@@ -555,7 +770,7 @@ def main():
         },
     }
     archive_path = ARCHIVE_DIR / f"digest-{date_str}.json"
-    archive_path.write_text(json.dumps(archive_data, indent=2, default=str), encoding="utf-8")
+    archive_path.write_bytes(orjson.dumps(archive_data, option=orjson.OPT_INDENT_2, default=str))
     log.info(f"Archive written to {archive_path}")
 
     total_items = sum(len(v) for v in sections.values())